@@ -0,0 +1,30 @@
+"""
+Ahead-of-time compilation of the batch capacity kernel with numba.pycc
+Run "python -m aisc_360_22._compression_aot" from the repository root at build time to produce
+_compression_native.*.so next to this file. compression.py imports it when present, so the app
+does not pay the Numba JIT warm-up on a cold start, and falls back to the Python/JIT kernel otherwise.
+Rebuild after changing _w_section_nominal_strength_array so the compiled copy does not go stale.
+"""
+
+import os
+from numba.pycc import CC
+import aisc_360_22.compression as comp
+
+cc = CC("_compression_native")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export("w_section_nominal_strength", "f8[:](f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], "
+                                         "f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)")
+def w_section_nominal_strength(area, Ix, Iy, J, warping_constant, flange_width, flange_thickness, section_depth, kdes, web_thickness,
+                               rx, ry, h0, effective_length_x, effective_length_y, effective_length_z, yield_stress,
+                               elastic_modulus, shear_modulus, x_brace_offset, y_brace_offset,
+                               flange_limiting_wt_ratio, web_limiting_wt_ratio):
+    return comp._w_section_nominal_strength_array(area, Ix, Iy, J, warping_constant, flange_width, flange_thickness, section_depth,
+                                                  kdes, web_thickness, rx, ry, h0, effective_length_x, effective_length_y, effective_length_z,
+                                                  yield_stress, elastic_modulus, shear_modulus, x_brace_offset, y_brace_offset,
+                                                  flange_limiting_wt_ratio, web_limiting_wt_ratio)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -2,11 +2,32 @@
 Member design per AISC 360-22 Chapter E: "Design of Members for Compression"
 """
 
-from math import pi, sqrt
+import os
+from math import exp, log, pi, sqrt
+import numpy as np
 import pandas as pd
-from aisc_360_22.steel_constants import STEEL_ELASTIC_MODULUS, STEEL_SHEAR_MODULUS
+from aisc_360_22.steel_constants import STEEL_ELASTIC_MODULUS, STEEL_SHEAR_MODULUS, PI2E
 import aisc_360_22.design_requirements as dr
 
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+    # Streamlit runs the script in a worker thread, and TBB can then hang at interpreter exit,
+    # so prefer OpenMP for the parallel kernel. This changes Numba's process-wide default, so it is
+    # only done when NUMBA_THREADING_LAYER_PRIORITY is unset; NUMBA_THREADING_LAYER still takes precedence.
+    if "NUMBA_THREADING_LAYER_PRIORITY" not in os.environ:
+        numba.config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+except ImportError:
+    # Numba is optional; without it the kernels below run as plain Python functions
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 """
 Steel design values prescribed in the code
@@ -14,14 +35,30 @@ Steel design values prescribed in the code
 PHI_C = 0.90        # LRFD strength reduction factor for compression
 OMEGA_C = 1.67      # ASD safety factor for compression
 
+"""
+Multiplier applied to nominal strength, and report labels, for each design method
+"""
+_METHOD_FACTORS = {"nominal": 1.0, "LRFD": PHI_C, "ASD": 1.0/OMEGA_C}
+_METHOD_REPORT_LABELS = {"LRFD": ("Resistance factor, φ (Section E1)", PHI_C, "Factored compressive strength, φPn"),
+                         "ASD": ("Safety factor, Ω (Section E1)", OMEGA_C, "Allowable compressive strength, Pn/Ω")}
+
+# Equation E3-2 evaluates 0.658**(Fy/Fe) as exp(ln(0.658)*Fy/Fe), which is cheaper than a fractional power
+_LOG_0_658 = log(0.658)
+
 """
 Table E7.1
 """
 EFFECTIVE_WIDTH_ADJUSTMENT_FACTORS = {"a": ("Stiffened elements except walls of suare and rectangular HSS", 0.18, 1.31),
                                       "b": ("Walls of square and rectangular HSS",                          0.20, 1.38),
                                       "c": ("All other elements",                                           0.22, 1.49)}
+# Numba cannot read a global dict, so the array kernels use these rows directly
+_FLANGE_ADJUSTMENT_FACTORS = EFFECTIVE_WIDTH_ADJUSTMENT_FACTORS["c"]
+_WEB_ADJUSTMENT_FACTORS = EFFECTIVE_WIDTH_ADJUSTMENT_FACTORS["a"]
+# Published rx and ry in the AISC database are rounded, so the exact values get their own columns
+DERIVED_PROPERTY_COLUMNS = ("rx_calc", "ry_calc", "h0")
 
 
+@njit(cache=True, fastmath=True)
 def member_slenderness(unbraced_length: float, radius_of_gyration: float, effective_length_factor: float=1.0) -> float:
     """
     Calculate member slenderness, Lc/r = KL/r
@@ -35,13 +72,17 @@ def member_slenderness(unbraced_length: float, radius_of_gyration: float, effect
     return effective_length_factor * unbraced_length / radius_of_gyration
 
 
+@njit(cache=True, fastmath=True)
 def elastic_buckling_stress(slenderness: float, elastic_modulus: float=STEEL_ELASTIC_MODULUS) -> float:
     """
     Calculate elastic buckling stress per Equation E3-4
     """
+    if elastic_modulus == STEEL_ELASTIC_MODULUS:
+        return PI2E / slenderness**2
     return pi**2 * elastic_modulus / slenderness**2
 
 
+@njit(cache=True, fastmath=True)
 def ft_elastic_buckling_stress_doubly_symmetric(z_effective_length: float, warping_constant: float, Ix: float, Iy: float, J: float,
                                  elastic_modulus: float=STEEL_ELASTIC_MODULUS, shear_modulus=STEEL_SHEAR_MODULUS) -> float:
     """
@@ -50,6 +91,7 @@ def ft_elastic_buckling_stress_doubly_symmetric(z_effective_length: float, warpi
     return ( (pi**2 * elastic_modulus * warping_constant) / z_effective_length**2 + shear_modulus*J ) * 1/(Ix + Iy) 
 
 
+@njit(cache=True, fastmath=True)
 def nominal_flexural_buckling_stress(yield_stress: float, elastic_stress: float=None, slenderness: float=None,
                                      elastic_modulus: float=STEEL_ELASTIC_MODULUS) -> float:
     """
@@ -58,12 +100,17 @@ def nominal_flexural_buckling_stress(yield_stress: float, elastic_stress: float=
     If only member slenderness is specified, elastic buckling stress will be determined using Equation E3-4. 
     If elastic buckling stress is specified, member slenderness will be ignored.
     """
-    if not elastic_stress:
-        elastic_stress = elastic_buckling_stress(slenderness, elastic_modulus)
-    if yield_stress/elastic_stress <= 2.25:
-        return ( 0.658**(yield_stress/elastic_stress) ) * yield_stress
+    # Branches are keyed on which argument was omitted so Numba can prune the unused one
+    if slenderness is None:
+        buckling_stress = elastic_stress
+    elif elastic_stress is None:
+        buckling_stress = elastic_buckling_stress(slenderness, elastic_modulus)
     else:
-        return 0.877 * elastic_stress
+        buckling_stress = elastic_stress
+    if yield_stress/buckling_stress <= 2.25:
+        return exp(_LOG_0_658 * yield_stress/buckling_stress) * yield_stress
+    else:
+        return 0.877 * buckling_stress
     
 
 def nominal_ft_buckling_stress_doubly_symmetric(yield_stress, z_effective_length: float, warping_constant: float, Ix: float, Iy: float, J: float,
@@ -76,6 +123,7 @@ def nominal_ft_buckling_stress_doubly_symmetric(yield_stress, z_effective_length
     return buckling_stress
 
 
+@njit(cache=True, fastmath=True)
 def ft_elastic_buckling_stress_i_minor_axis_offset(z_effective_length: float, Iy, J, area, r0, h0, y_offset, 
                                                    elastic_modulus=STEEL_ELASTIC_MODULUS, shear_modulus=STEEL_SHEAR_MODULUS):
     """
@@ -84,6 +132,7 @@ def ft_elastic_buckling_stress_i_minor_axis_offset(z_effective_length: float, Iy
     return (pi**2*elastic_modulus*Iy/z_effective_length**2*(h0**2/4+y_offset**2)+shear_modulus*J) * 1/(area*r0**2)
 
 
+@njit(cache=True, fastmath=True)
 def ft_elastic_buckling_stress_i_major_axis_offset(z_effective_length, Ix, Iy, J, area, r0, h0, x_offset,
                                                    elastic_modulus=STEEL_ELASTIC_MODULUS, shear_modulus=STEEL_SHEAR_MODULUS):
     """
@@ -92,6 +141,7 @@ def ft_elastic_buckling_stress_i_major_axis_offset(z_effective_length, Ix, Iy, J
     return (pi**2*elastic_modulus*Iy/z_effective_length**2 * (h0**2/4+Ix/Iy*x_offset**2)+shear_modulus*J) * 1/(area*r0**2)
 
 
+@njit(cache=True, fastmath=True)
 def calc_r0(rx, ry, xa, ya):
     """
     Use Equation E4-11 to calculate r0 for use in Equations 4-10 and 4-12
@@ -113,6 +163,7 @@ def nominal_ft_buckling_stress_i_bracing_offset(yield_stress, z_effective_length
     return buckling_stress
 
 
+@njit(cache=True, fastmath=True)
 def elastic_local_buckling_stress(c2: float, wt_ratio: float, limiting_wt_ratio: float, yield_stress: float) -> float:
     """
     Elastic local buckling stress per Equation E7-5
@@ -120,55 +171,81 @@ def elastic_local_buckling_stress(c2: float, wt_ratio: float, limiting_wt_ratio:
     return (c2*limiting_wt_ratio/wt_ratio)**2 * yield_stress
 
 
-def effective_width(nominal_width, wt_ratio, limiting_wt_ratio, yield_stress, nominal_stress, elastic_local_stress, c1) -> float:
+@njit(cache=True, fastmath=True)
+def effective_width(nominal_width, wt_ratio, limiting_wt_ratio, yield_stress, nominal_stress, elastic_local_stress, c1,
+                    root_stress_ratio=-1.0) -> float:
     """
     Effective width for slender elements (excluding round HSS) per Equations E7-2 and E7-3.
+    root_stress_ratio = sqrt(Fy/Fn) may be passed in when the caller already has it.
     """
-    if wt_ratio <= limiting_wt_ratio*sqrt(yield_stress/nominal_stress):
+    if root_stress_ratio < 0:
+        root_stress_ratio = sqrt(yield_stress/nominal_stress)
+    if wt_ratio <= limiting_wt_ratio*root_stress_ratio:
         return nominal_width
     else:
-        return nominal_width * (1-c1*sqrt(elastic_local_stress/nominal_stress)) * sqrt(elastic_local_stress/nominal_stress)
+        local_stress_ratio = sqrt(elastic_local_stress/nominal_stress)
+        return nominal_width * (1-c1*local_stress_ratio) * local_stress_ratio
     
 
-def w_section_effective_area(gross_area, flange_width, flange_thickness,
-                             section_depth, kdes, web_thickness, 
-                             yield_stress, nominal_stress) -> float:
+def _w_check_slender_and_effective_area(gross_area, flange_width, flange_thickness, section_depth, kdes, web_thickness,
+                                        yield_stress, nominal_stress, elastic_modulus=STEEL_ELASTIC_MODULUS):
     """
-    Calculate the effective area of a W section
+    Determine whether a W section is slender for compression and calculate its effective area.
+    The width-to-thickness ratios and limits are computed once and shared by both checks.
+    Returns (effective_area, is_slender)
     """
     flange_wt_ratio = flange_width / (2*flange_thickness)
     web_height = section_depth - 2*kdes
     web_wt_ratio = web_height / web_thickness
-    flange_c1 = EFFECTIVE_WIDTH_ADJUSTMENT_FACTORS["c"][1]
-    flange_c2 = EFFECTIVE_WIDTH_ADJUSTMENT_FACTORS["c"][2]
-    flange_limiting_wt_ratio = dr.limiting_wt_ratio_comp(table_case=1, elastic_modulus=STEEL_ELASTIC_MODULUS,
+    flange_limiting_wt_ratio = dr.limiting_wt_ratio_comp(table_case=1, elastic_modulus=elastic_modulus,
                                                     yield_strength=yield_stress)
-    flange_elastic_local_buckling_stress = elastic_local_buckling_stress(flange_c2, flange_wt_ratio, flange_limiting_wt_ratio, yield_stress)
-    effective_flange_width = effective_width(flange_width, flange_wt_ratio, flange_limiting_wt_ratio, 
-                                             yield_stress, nominal_stress, flange_elastic_local_buckling_stress, flange_c1)
-    
-    web_c1 = EFFECTIVE_WIDTH_ADJUSTMENT_FACTORS["a"][1]
-    web_c2 = EFFECTIVE_WIDTH_ADJUSTMENT_FACTORS["a"][2]
-    web_limiting_wt_ratio = dr.limiting_wt_ratio_comp(table_case=5, elastic_modulus=STEEL_ELASTIC_MODULUS, yield_strength=yield_stress)
-    web_elastic_local_buckling_stress = elastic_local_buckling_stress(web_c2, web_wt_ratio, web_limiting_wt_ratio, yield_stress)
-    effective_web_height = effective_width(web_height, web_wt_ratio, web_limiting_wt_ratio, 
-                                           yield_stress, nominal_stress, web_elastic_local_buckling_stress, web_c1)
-    if dr.is_slender_comp(flange_wt_ratio, flange_limiting_wt_ratio) or dr.is_slender_comp(web_wt_ratio, web_limiting_wt_ratio):
-        effective_area = gross_area - 2*flange_thickness*(flange_width-effective_flange_width) - web_thickness*(web_height-effective_web_height)
-    else:
-        effective_area = gross_area
+    web_limiting_wt_ratio = dr.limiting_wt_ratio_comp(table_case=5, elastic_modulus=elastic_modulus, yield_strength=yield_stress)
+    is_slender_flange = dr.is_slender_comp(flange_wt_ratio, flange_limiting_wt_ratio)
+    is_slender_web = dr.is_slender_comp(web_wt_ratio, web_limiting_wt_ratio)
+    # Nonslender elements are fully effective (Fn <= Fy), so only slender elements need Equations E7-2 and E7-3
+    if not (is_slender_flange or is_slender_web):
+        return gross_area, False
+
+    effective_area = gross_area
+    root_stress_ratio = sqrt(yield_stress/nominal_stress)
+    if is_slender_flange:
+        flange_c1 = EFFECTIVE_WIDTH_ADJUSTMENT_FACTORS["c"][1]
+        flange_c2 = EFFECTIVE_WIDTH_ADJUSTMENT_FACTORS["c"][2]
+        flange_elastic_local_buckling_stress = elastic_local_buckling_stress(flange_c2, flange_wt_ratio, flange_limiting_wt_ratio, yield_stress)
+        effective_flange_width = effective_width(flange_width, flange_wt_ratio, flange_limiting_wt_ratio, 
+                                                 yield_stress, nominal_stress, flange_elastic_local_buckling_stress, flange_c1,
+                                                 root_stress_ratio)
+        effective_area -= 2*flange_thickness*(flange_width-effective_flange_width)
+    if is_slender_web:
+        web_c1 = EFFECTIVE_WIDTH_ADJUSTMENT_FACTORS["a"][1]
+        web_c2 = EFFECTIVE_WIDTH_ADJUSTMENT_FACTORS["a"][2]
+        web_elastic_local_buckling_stress = elastic_local_buckling_stress(web_c2, web_wt_ratio, web_limiting_wt_ratio, yield_stress)
+        effective_web_height = effective_width(web_height, web_wt_ratio, web_limiting_wt_ratio, 
+                                               yield_stress, nominal_stress, web_elastic_local_buckling_stress, web_c1,
+                                               root_stress_ratio)
+        effective_area -= web_thickness*(web_height-effective_web_height)
+    return effective_area, True
+
+
+def w_section_effective_area(gross_area, flange_width, flange_thickness,
+                             section_depth, kdes, web_thickness, 
+                             yield_stress, nominal_stress, elastic_modulus=STEEL_ELASTIC_MODULUS) -> float:
+    """
+    Calculate the effective area of a W section
+    """
+    effective_area, _ = _w_check_slender_and_effective_area(gross_area, flange_width, flange_thickness, section_depth, kdes, web_thickness,
+                                                            yield_stress, nominal_stress, elastic_modulus)
     return effective_area
 
 
-def w_section_capacity(area, Ix, Iy, J, warping_constant, flange_width, flange_thickness, section_depth, kdes, web_thickness,
-                       unbraced_length_x, unbraced_length_y, unbraced_length_z,
-                       yield_stress, design_method="nominal",
-                       elastic_modulus=STEEL_ELASTIC_MODULUS, shear_modulus=STEEL_SHEAR_MODULUS,
-                       kx=1.0, ky=1.0, kz=1.0,
-                       x_brace_offset=0.0, y_brace_offset=0.0, return_report=False):
+def _w_section_capacity(area, Ix, Iy, J, warping_constant, flange_width, flange_thickness, section_depth, kdes, web_thickness,
+                        unbraced_length_x, unbraced_length_y, unbraced_length_z,
+                        yield_stress, design_method, elastic_modulus, shear_modulus,
+                        kx, ky, kz, x_brace_offset, y_brace_offset, build_report, rx=None, ry=None, h0=None):
     """
-    Calculate the compression capacity of a W column using all applicable limit states
-    Returns nominal capacity unless LRFD or ASD is specified
+    Shared body of w_section_capacity and w_section_capacity_from_series
+    Returns (capacity, report, warnings, notes); report is None unless build_report is True
+    rx, ry and h0 are computed from the section properties unless precomputed values are supplied
     """
     # Make zero lengths nonzero to avoid division by zero errors
     if unbraced_length_x == 0:
@@ -179,89 +256,283 @@ def w_section_capacity(area, Ix, Iy, J, warping_constant, flange_width, flange_t
         unbraced_length_z = 0.00001
     warnings = []
     notes = []
-    report = {}
-    rx = sqrt(Ix/area)
-    ry = sqrt(Iy/area)
+    if rx is None:
+        rx = sqrt(Ix/area)
+    if ry is None:
+        ry = sqrt(Iy/area)
     r0 = calc_r0(rx, ry, x_brace_offset, y_brace_offset)
-    h0 = section_depth - flange_thickness
+    if h0 is None:
+        h0 = section_depth - flange_thickness
     slenderness_x = member_slenderness(unbraced_length_x, rx, kx)
     slenderness_y = member_slenderness(unbraced_length_y, ry, ky)
     design_slenderness = max(slenderness_x, slenderness_y)
-    report.update({"Governing slenderness ratio, Lc/r": [design_slenderness, ""]})
     if design_slenderness > 200:
         warnings.append("Slenderness ratio exceeds 200.")
     effective_length_z = unbraced_length_z*kz
     flexural_buckling_stress = nominal_flexural_buckling_stress(yield_stress=yield_stress, slenderness=design_slenderness,
                                                                 elastic_modulus=elastic_modulus)
-    report.update({"Nominal flexural buckling stress (Equations E3-2, E3-3)": [flexural_buckling_stress, "stress"]})
     if x_brace_offset or y_brace_offset:
         torsional_buckling_stress = nominal_ft_buckling_stress_i_bracing_offset(yield_stress, effective_length_z, Ix, Iy, J, area,
                                                                                 r0, h0, x_brace_offset, y_brace_offset, 
                                                                                 elastic_modulus, shear_modulus)
-        report.update({"Nominal torsional buckling stress (Equation E4-2)": [torsional_buckling_stress, "stress"]})
+        torsional_label = "Nominal torsional buckling stress (Equation E4-2)"
     else:
         torsional_buckling_stress = nominal_ft_buckling_stress_doubly_symmetric(yield_stress=yield_stress, z_effective_length=effective_length_z,
                                                                             warping_constant=warping_constant, Ix=Ix, Iy=Iy, J=J, 
                                                                             elastic_modulus=elastic_modulus, shear_modulus=shear_modulus)
-        report.update({"Nominal torsional buckling stress (Equations E4-10, E4-12)": [torsional_buckling_stress, "stress"]})    
+        torsional_label = "Nominal torsional buckling stress (Equations E4-10, E4-12)"
     if x_brace_offset and y_brace_offset:
         warnings.append("Torsional buckling results not valid with bracing offset in both axes.")
     
     nominal_stress = min(flexural_buckling_stress, torsional_buckling_stress)
-    report.update({"Governing nominal buckling stress, Fn": [nominal_stress, "stress"]})
-    effective_area = w_section_effective_area(gross_area=area, flange_width=flange_width, flange_thickness=flange_thickness,
-                                              section_depth=section_depth, kdes=kdes, web_thickness=web_thickness, 
-                                              yield_stress=yield_stress, nominal_stress=nominal_stress)
-    report.update({"Effective area accounting for slender elements, Ae (Section E7)": [effective_area, "area"]})
-    slender = dr.w_is_slender_comp(flange_width, flange_thickness, section_depth, kdes, web_thickness, yield_stress, elastic_modulus)
+    effective_area, slender = _w_check_slender_and_effective_area(gross_area=area, flange_width=flange_width, flange_thickness=flange_thickness,
+                                                                  section_depth=section_depth, kdes=kdes, web_thickness=web_thickness, 
+                                                                  yield_stress=yield_stress, nominal_stress=nominal_stress,
+                                                                  elastic_modulus=elastic_modulus)
     if slender:
         notes.append("Shape is slender for compression.")
     nominal_compressive_strength = nominal_stress * effective_area
-    report.update({"Nominal compressive strength, Pn (Equations E3-1, E4-1, E7-1)": [nominal_compressive_strength, "force"]})
-
-    match design_method:
-        case "nominal":
-            if return_report:
-                return report, warnings, notes
-            else:
-                return nominal_compressive_strength, warnings, notes
-        case "LRFD":
-            factored_strength = PHI_C * nominal_compressive_strength
-            report.update({"Resistance factor, φ (Section E1)": [PHI_C, ""], "Factored compressive strength, φPn": [factored_strength, "force"]})
-            if return_report:
-                return report, warnings, notes
-            else:
-                return factored_strength, warnings, notes
-        case "ASD":
-            allowable_strength = nominal_compressive_strength / OMEGA_C
-            report.update({"Safety factor, Ω (Section E1)": [OMEGA_C, ""], "Allowable compressive strength, Pn/Ω": [allowable_strength, "force"]})
-            if return_report:
-                return report, warnings, notes
-            else:
-                return allowable_strength, warnings, notes
-        case _:
-            raise ValueError("Design method must be \'nominal\', \'LRFD\', or \'ASD\'.")
+
+    if design_method not in _METHOD_FACTORS:
+        raise ValueError("Design method must be \'nominal\', \'LRFD\', or \'ASD\'.")
+    design_strength = _METHOD_FACTORS[design_method] * nominal_compressive_strength
+    if not build_report:
+        return design_strength, None, warnings, notes
+
+    # The report is only built when requested, so batch callers skip it entirely
+    report = {"Governing slenderness ratio, Lc/r": [design_slenderness, ""],
+              "Nominal flexural buckling stress (Equations E3-2, E3-3)": [flexural_buckling_stress, "stress"],
+              torsional_label: [torsional_buckling_stress, "stress"],
+              "Governing nominal buckling stress, Fn": [nominal_stress, "stress"],
+              "Effective area accounting for slender elements, Ae (Section E7)": [effective_area, "area"],
+              "Nominal compressive strength, Pn (Equations E3-1, E4-1, E7-1)": [nominal_compressive_strength, "force"]}
+    if design_method in _METHOD_REPORT_LABELS:
+        factor_label, factor, strength_label = _METHOD_REPORT_LABELS[design_method]
+        report.update({factor_label: [factor, ""], strength_label: [design_strength, "force"]})
+    return design_strength, report, warnings, notes
+
+
+def w_section_capacity(area, Ix, Iy, J, warping_constant, flange_width, flange_thickness, section_depth, kdes, web_thickness,
+                       unbraced_length_x, unbraced_length_y, unbraced_length_z,
+                       yield_stress, design_method="nominal",
+                       elastic_modulus=STEEL_ELASTIC_MODULUS, shear_modulus=STEEL_SHEAR_MODULUS,
+                       kx=1.0, ky=1.0, kz=1.0,
+                       x_brace_offset=0.0, y_brace_offset=0.0, return_report=False,
+                       rx=None, ry=None, h0=None):
+    """
+    Calculate the compression capacity of a W column using all applicable limit states
+    Returns nominal capacity unless LRFD or ASD is specified
+    Precomputed rx, ry and h0 (see add_derived_properties) are used when supplied
+    """
+    capacity, report, warnings, notes = _w_section_capacity(area, Ix, Iy, J, warping_constant, flange_width, flange_thickness,
+                                                            section_depth, kdes, web_thickness,
+                                                            unbraced_length_x, unbraced_length_y, unbraced_length_z,
+                                                            yield_stress, design_method, elastic_modulus, shear_modulus,
+                                                            kx, ky, kz, x_brace_offset, y_brace_offset, return_report,
+                                                            rx, ry, h0)
+    if return_report:
+        return report, warnings, notes
+    else:
+        return capacity, warnings, notes
 
 
 def w_section_capacity_from_series(section: pd.Series, unbraced_length_x, unbraced_length_y, unbraced_length_z,
                        yield_stress, design_method="nominal",
                        elastic_modulus=STEEL_ELASTIC_MODULUS, shear_modulus=STEEL_SHEAR_MODULUS,
                        kx=1.0, ky=1.0, kz=1.0,
-                       x_brace_offset=0.0, y_brace_offset=0.0, value_only=False, return_report=False) -> float:
-    area=section.loc["A"]
-    Ix=section.loc["Ix"]
-    Iy=section.loc["Iy"]
-    J=section.loc["J"]
-    warping_constant=section.loc["Cw"]
-    flange_width=section.loc["bf"]
-    flange_thickness=section.loc["tf"]
-    section_depth=section.loc["d"]
-    kdes=section.loc["kdes"]
-    web_thickness=section.loc["tw"]
-    capacity, warnings, notes = w_section_capacity(area, Ix, Iy, J, warping_constant, flange_width, flange_thickness, section_depth, kdes, web_thickness, 
-                              unbraced_length_x, unbraced_length_y, unbraced_length_z, yield_stress,
-                              design_method, elastic_modulus, shear_modulus, kx, ky, kz, x_brace_offset, y_brace_offset, return_report=return_report)
+                       x_brace_offset=0.0, y_brace_offset=0.0, value_only=False):
+    """
+    Calculate the compression capacity of a W section stored as a row of the section database
+    Returns (capacity, report, warnings, notes), or only the capacity if value_only is True
+    """
+    area, Ix, Iy, J, warping_constant, flange_width, flange_thickness, section_depth, kdes, web_thickness = (
+        section[["A", "Ix", "Iy", "J", "Cw", "bf", "tf", "d", "kdes", "tw"]].to_numpy(dtype=np.float64))
+    if set(DERIVED_PROPERTY_COLUMNS).issubset(section.index):
+        rx, ry, h0 = section[list(DERIVED_PROPERTY_COLUMNS)].to_numpy(dtype=np.float64)
+    else:
+        rx = ry = h0 = None
+    capacity, report, warnings, notes = _w_section_capacity(area, Ix, Iy, J, warping_constant, flange_width, flange_thickness,
+                                                            section_depth, kdes, web_thickness,
+                                                            unbraced_length_x, unbraced_length_y, unbraced_length_z,
+                                                            yield_stress, design_method, elastic_modulus, shear_modulus,
+                                                            kx, ky, kz, x_brace_offset, y_brace_offset, not value_only,
+                                                            rx, ry, h0)
     if value_only:
         return capacity
     else:
-        return capacity, warnings, notes
\ No newline at end of file
+        return capacity, report, warnings, notes
+
+
+def add_derived_properties(sections: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a copy of a W section DataFrame with the radii of gyration and the flange centroid distance, h0,
+    precomputed in DERIVED_PROPERTY_COLUMNS so capacity checks do not recompute them on every call
+    """
+    area, Ix, Iy, section_depth, flange_thickness = (sections[key].to_numpy(dtype=np.float64) for key in ("A", "Ix", "Iy", "d", "tf"))
+    return sections.assign(rx_calc=np.sqrt(Ix/area), ry_calc=np.sqrt(Iy/area), h0=section_depth - flange_thickness)
+
+
+@njit(cache=True)
+def _nominal_flexural_buckling_stress_array(yield_stress, elastic_stress):
+    """
+    Array form of Equations E3-2 and E3-3 for use by w_section_capacity_vectorized
+    """
+    stress_ratio = yield_stress / elastic_stress
+    return np.where(stress_ratio <= 2.25, np.exp(_LOG_0_658 * stress_ratio) * yield_stress, 0.877 * elastic_stress)
+
+
+@njit(cache=True)
+def _effective_width_array(nominal_width, wt_ratio, limiting_wt_ratio, root_stress_ratio, nominal_stress, elastic_local_stress, c1):
+    """
+    Array form of Equations E7-2 and E7-3 for use by w_section_capacity_vectorized
+    root_stress_ratio = sqrt(Fy/Fn), shared by the flange and web checks
+    """
+    local_stress_ratio = np.sqrt(elastic_local_stress / nominal_stress)
+    return np.where(wt_ratio <= limiting_wt_ratio*root_stress_ratio,
+                    nominal_width, nominal_width * (1-c1*local_stress_ratio) * local_stress_ratio)
+
+
+@njit(cache=True)
+def _w_section_nominal_strength_array(area, Ix, Iy, J, warping_constant, flange_width, flange_thickness, section_depth, kdes, web_thickness,
+                                      rx, ry, h0,
+                                      effective_length_x, effective_length_y, effective_length_z, yield_stress,
+                                      elastic_modulus, shear_modulus, x_brace_offset, y_brace_offset,
+                                      flange_limiting_wt_ratio, web_limiting_wt_ratio):
+    """
+    Nominal compressive strength, Pn, of an array of W sections (Equations E3-1, E4-1, E7-1)
+    Effective lengths are K*L and rx, ry, h0 are section property arrays, all computed once by the caller.
+    All arguments are positional so this can also be compiled ahead of time by _compression_aot.py
+    """
+    design_slenderness = np.maximum(effective_length_x/rx, effective_length_y/ry)
+    flexural_buckling_stress = _nominal_flexural_buckling_stress_array(yield_stress,
+                                                                       elastic_buckling_stress(design_slenderness, elastic_modulus))
+    if x_brace_offset or y_brace_offset:
+        r0 = calc_r0(rx, ry, x_brace_offset, y_brace_offset)
+        torsional_elastic_stress = np.minimum(
+            ft_elastic_buckling_stress_i_major_axis_offset(effective_length_z, Ix, Iy, J, area, r0, h0, x_brace_offset,
+                                                           elastic_modulus, shear_modulus),
+            ft_elastic_buckling_stress_i_minor_axis_offset(effective_length_z, Iy, J, area, r0, h0, y_brace_offset,
+                                                           elastic_modulus, shear_modulus))
+    else:
+        torsional_elastic_stress = ft_elastic_buckling_stress_doubly_symmetric(effective_length_z, warping_constant, Ix, Iy, J,
+                                                                               elastic_modulus, shear_modulus)
+    torsional_buckling_stress = _nominal_flexural_buckling_stress_array(yield_stress, torsional_elastic_stress)
+    nominal_stress = np.minimum(flexural_buckling_stress, torsional_buckling_stress)
+
+    flange_wt_ratio = flange_width / (2*flange_thickness)
+    web_height = section_depth - 2*kdes
+    web_wt_ratio = web_height / web_thickness
+    root_stress_ratio = np.sqrt(yield_stress/nominal_stress)
+    flange_c1 = _FLANGE_ADJUSTMENT_FACTORS[1]
+    flange_c2 = _FLANGE_ADJUSTMENT_FACTORS[2]
+    effective_flange_width = _effective_width_array(flange_width, flange_wt_ratio, flange_limiting_wt_ratio, root_stress_ratio, nominal_stress,
+                                                    elastic_local_buckling_stress(flange_c2, flange_wt_ratio, flange_limiting_wt_ratio, yield_stress),
+                                                    flange_c1)
+    web_c1 = _WEB_ADJUSTMENT_FACTORS[1]
+    web_c2 = _WEB_ADJUSTMENT_FACTORS[2]
+    effective_web_height = _effective_width_array(web_height, web_wt_ratio, web_limiting_wt_ratio, root_stress_ratio, nominal_stress,
+                                                  elastic_local_buckling_stress(web_c2, web_wt_ratio, web_limiting_wt_ratio, yield_stress),
+                                                  web_c1)
+    slender = (flange_wt_ratio > flange_limiting_wt_ratio) | (web_wt_ratio > web_limiting_wt_ratio)
+    effective_area = np.where(slender,
+                              area - 2*flange_thickness*(flange_width-effective_flange_width) - web_thickness*(web_height-effective_web_height),
+                              area)
+    return nominal_stress * effective_area
+
+
+@njit(parallel=True, cache=True)
+def _w_section_nominal_strength_parallel(area, Ix, Iy, J, warping_constant, flange_width, flange_thickness, section_depth, kdes, web_thickness,
+                                         rx, ry, h0,
+                                         effective_length_x, effective_length_y, effective_length_z, yield_stress,
+                                         elastic_modulus, shear_modulus, x_brace_offset, y_brace_offset,
+                                         flange_limiting_wt_ratio, web_limiting_wt_ratio):
+    """
+    Same as _w_section_nominal_strength_array, but loops over sections in parallel using the scalar kernels.
+    Only worthwhile when Numba is installed.
+    """
+    flange_c1 = _FLANGE_ADJUSTMENT_FACTORS[1]
+    flange_c2 = _FLANGE_ADJUSTMENT_FACTORS[2]
+    web_c1 = _WEB_ADJUSTMENT_FACTORS[1]
+    web_c2 = _WEB_ADJUSTMENT_FACTORS[2]
+    nominal_compressive_strength = np.empty(area.shape[0])
+    for i in prange(area.shape[0]):
+        design_slenderness = max(effective_length_x/rx[i], effective_length_y/ry[i])
+        flexural_buckling_stress = nominal_flexural_buckling_stress(yield_stress,
+                                                                    elastic_buckling_stress(design_slenderness, elastic_modulus))
+        if x_brace_offset or y_brace_offset:
+            r0 = calc_r0(rx[i], ry[i], x_brace_offset, y_brace_offset)
+            torsional_elastic_stress = min(
+                ft_elastic_buckling_stress_i_major_axis_offset(effective_length_z, Ix[i], Iy[i], J[i], area[i], r0, h0[i], x_brace_offset,
+                                                               elastic_modulus, shear_modulus),
+                ft_elastic_buckling_stress_i_minor_axis_offset(effective_length_z, Iy[i], J[i], area[i], r0, h0[i], y_brace_offset,
+                                                               elastic_modulus, shear_modulus))
+        else:
+            torsional_elastic_stress = ft_elastic_buckling_stress_doubly_symmetric(effective_length_z, warping_constant[i], Ix[i], Iy[i], J[i],
+                                                                                   elastic_modulus, shear_modulus)
+        torsional_buckling_stress = nominal_flexural_buckling_stress(yield_stress, torsional_elastic_stress)
+        nominal_stress = min(flexural_buckling_stress, torsional_buckling_stress)
+
+        flange_wt_ratio = flange_width[i] / (2*flange_thickness[i])
+        web_height = section_depth[i] - 2*kdes[i]
+        web_wt_ratio = web_height / web_thickness[i]
+        root_stress_ratio = sqrt(yield_stress/nominal_stress)
+        effective_area = area[i]
+        if flange_wt_ratio > flange_limiting_wt_ratio:
+            effective_flange_width = effective_width(flange_width[i], flange_wt_ratio, flange_limiting_wt_ratio, yield_stress, nominal_stress,
+                                                     elastic_local_buckling_stress(flange_c2, flange_wt_ratio, flange_limiting_wt_ratio, yield_stress),
+                                                     flange_c1, root_stress_ratio)
+            effective_area -= 2*flange_thickness[i]*(flange_width[i]-effective_flange_width)
+        if web_wt_ratio > web_limiting_wt_ratio:
+            effective_web_height = effective_width(web_height, web_wt_ratio, web_limiting_wt_ratio, yield_stress, nominal_stress,
+                                                   elastic_local_buckling_stress(web_c2, web_wt_ratio, web_limiting_wt_ratio, yield_stress),
+                                                   web_c1, root_stress_ratio)
+            effective_area -= web_thickness[i]*(web_height-effective_web_height)
+        nominal_compressive_strength[i] = nominal_stress * effective_area
+    return nominal_compressive_strength
+
+
+# Prefer the ahead-of-time compiled kernel if _compression_aot.py has been run for this install,
+# then the parallel Numba kernel, then plain NumPy
+try:
+    from aisc_360_22._compression_native import w_section_nominal_strength as _w_section_nominal_strength
+except ImportError:
+    if NUMBA_AVAILABLE:
+        _w_section_nominal_strength = _w_section_nominal_strength_parallel
+    else:
+        _w_section_nominal_strength = _w_section_nominal_strength_array
+
+
+def w_section_capacity_vectorized(sections: pd.DataFrame, unbraced_length_x, unbraced_length_y, unbraced_length_z,
+                                  yield_stress, design_method="nominal",
+                                  elastic_modulus=STEEL_ELASTIC_MODULUS, shear_modulus=STEEL_SHEAR_MODULUS,
+                                  kx=1.0, ky=1.0, kz=1.0,
+                                  x_brace_offset=0.0, y_brace_offset=0.0) -> pd.Series:
+    """
+    Calculate the compression capacity of every W section in a DataFrame in a single pass.
+    Checks the same limit states as w_section_capacity, evaluated as NumPy array expressions.
+    Returns nominal capacities unless LRFD or ASD is specified
+    """
+    # Make zero lengths nonzero to avoid division by zero errors
+    if unbraced_length_x == 0:
+        unbraced_length_x = 0.00001
+    if unbraced_length_y == 0:
+        unbraced_length_y = 0.00001
+    if unbraced_length_z == 0:
+        unbraced_length_z = 0.00001
+    if not set(DERIVED_PROPERTY_COLUMNS).issubset(sections.columns):
+        sections = add_derived_properties(sections)
+    properties = (sections[key].to_numpy(dtype=np.float64) for key in ("A", "Ix", "Iy", "J", "Cw", "bf", "tf", "d", "kdes", "tw",
+                                                                        *DERIVED_PROPERTY_COLUMNS))
+    # Table B4.1a cases 1 (flange) and 5 (web) share the same sqrt(E/Fy) term
+    root_modulus_ratio = sqrt(elastic_modulus/yield_stress)
+    flange_limiting_wt_ratio = dr.LIMITING_WT_RATIO_COEFFICIENTS[1] * root_modulus_ratio
+    web_limiting_wt_ratio = dr.LIMITING_WT_RATIO_COEFFICIENTS[5] * root_modulus_ratio
+    nominal_compressive_strength = _w_section_nominal_strength(*properties,
+                                                               float(kx*unbraced_length_x), float(ky*unbraced_length_y), float(kz*unbraced_length_z),
+                                                               float(yield_stress), float(elastic_modulus), float(shear_modulus),
+                                                               float(x_brace_offset), float(y_brace_offset),
+                                                               flange_limiting_wt_ratio, web_limiting_wt_ratio)
+
+    if design_method not in _METHOD_FACTORS:
+        raise ValueError("Design method must be \'nominal\', \'LRFD\', or \'ASD\'.")
+    return pd.Series(_METHOD_FACTORS[design_method] * nominal_compressive_strength, index=sections.index)
\ No newline at end of file
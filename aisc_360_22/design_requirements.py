@@ -2,9 +2,17 @@
 AISC 360-22 Chapter B: "Design Requirements"
 """
 
+from functools import lru_cache
 from math import sqrt
 
 
+"""
+Table B4.1a limiting width-to-thickness ratio coefficients, indexed by case number.
+Case 2 is multiplied by sqrt(kc*E/Fy), case 9 by E/Fy, and all other cases by sqrt(E/Fy).
+"""
+LIMITING_WT_RATIO_COEFFICIENTS = (None, 0.56, 0.64, 0.45, 0.75, 1.49, 1.40, 0.40, 1.49, 0.11)
+
+
 def is_slender_comp(wt_ratio: float, limiting_wt_ratio: float) -> bool:
     """
     Determine if member is slender for axial compression per Table B4.1a
@@ -20,7 +28,7 @@ def w_is_slender_comp(flange_width, flange_thickness, section_depth, kdes, web_t
     Determine if a W section is slender for axial compression
     """
     flange_wt_ratio = flange_width / (2*flange_thickness)
-    web_height = section_depth - kdes
+    web_height = section_depth - 2*kdes
     web_wt_ratio = web_height / web_thickness
 
     flange_limiting_wt_ratio = limiting_wt_ratio_comp(1, elastic_modulus, yield_stress)
@@ -32,28 +40,20 @@ def w_is_slender_comp(flange_width, flange_thickness, section_depth, kdes, web_t
         return False
 
 
-def limiting_wt_ratio_comp(table_case: int, elastic_modulus: float, yield_strength: float, kc: float=None) -> float:
+@lru_cache(maxsize=64)
+def limiting_wt_ratio_comp(table_case: int, elastic_modulus: float, yield_strength: float, kc: float=-1.0) -> float:
     """
     Limiting width-to-thickness ratios per Table B4.1a
+    kc is only required for table case 2.
+    Results are cached since E and Fy are the same for every section in a batch.
     """
-    match table_case:
-        case 1:
-            return 0.56*sqrt(elastic_modulus/yield_strength)
-        case 2:
-            return 0.64*sqrt(kc*elastic_modulus/yield_strength)
-        case 3:
-            return 0.45*sqrt(elastic_modulus/yield_strength)
-        case 4:
-            return 0.75*sqrt(elastic_modulus/yield_strength)
-        case 5:
-            return 1.49*sqrt(elastic_modulus/yield_strength)
-        case 6:
-            return 1.40*sqrt(elastic_modulus/yield_strength)
-        case 7:
-            return 0.40*sqrt(elastic_modulus/yield_strength)
-        case 8:
-            return 1.49*sqrt(elastic_modulus/yield_strength)
-        case 9:
-            return 0.11*elastic_modulus/yield_strength
-        case _:
-            raise ValueError("Table case must be integer between 1 and 9.")
+    if table_case == 2:
+        if kc < 0:
+            raise ValueError("kc must be specified for table case 2.")
+        return LIMITING_WT_RATIO_COEFFICIENTS[2]*sqrt(kc*elastic_modulus/yield_strength)
+    elif table_case == 9:
+        return LIMITING_WT_RATIO_COEFFICIENTS[9]*elastic_modulus/yield_strength
+    elif 1 <= table_case <= 8:
+        return LIMITING_WT_RATIO_COEFFICIENTS[table_case]*sqrt(elastic_modulus/yield_strength)
+    else:
+        raise ValueError("Table case must be integer between 1 and 9.")
\ No newline at end of file
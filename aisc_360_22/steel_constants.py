@@ -2,5 +2,8 @@
 Steel design constants defined in AISC 360-22
 """
 
+from math import pi
+
 STEEL_ELASTIC_MODULUS = 29000 # ksi
-STEEL_SHEAR_MODULUS = 11200 # ksi
\ No newline at end of file
+STEEL_SHEAR_MODULUS = 11200 # ksi
+PI2E = pi**2 * STEEL_ELASTIC_MODULUS # ksi, numerator of Equation E3-4
\ No newline at end of file
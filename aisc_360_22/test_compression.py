@@ -1,4 +1,6 @@
 import aisc_360_22.compression as comp
+import aisc_360_22.design_requirements as dr
+import pandas as pd
 from math import isclose
 
 
@@ -195,3 +197,96 @@ def test_w_section_capacity():
                                                         yield_stress=Fy, design_method="LRFD", kx=kx, ky=ky, kz=kz,
                                                         x_brace_offset=0, y_brace_offset=0)
         assert isclose(capacity, strength, rel_tol=0.003)
+
+
+def test_w_section_capacity_vectorized():
+    sections = pd.DataFrame({"A":[9.71, 6.49, 42.7],
+                             "Ix":[171, 118, 1710],
+                             "Iy":[36.6, 11.4, 677],
+                             "J":[0.583, 0.239, 15.2],
+                             "Cw":[791, 275, 31700],
+                             "bf":[7.96, 5.75, 15.5],
+                             "tf":[0.435, 0.360, 1.09],
+                             "d":[9.73, 10.2, 14.8],
+                             "kdes":[0.935, 0.660, 1.69],
+                             "tw":[0.290, 0.240, 0.680]},
+                            index=["W10X33", "W10X22", "W14X145"])
+    
+    for Lx, Ly, Lz, design_method in [(10*12, 10*12, 10*12, "ASD"), (19.26*12, 5*12, 5*12, "LRFD"), (0, 24*12, 0, "nominal")]:
+        capacities = comp.w_section_capacity_vectorized(sections, Lx, Ly, Lz, 50, design_method)
+        for name, section in sections.iterrows():
+            capacity = comp.w_section_capacity_from_series(section, Lx, Ly, Lz, 50, design_method, value_only=True)
+            assert isclose(capacities[name], capacity)
+
+    capacities = comp.w_section_capacity_vectorized(sections, 10*12, 10*12, 10*12, 50, "LRFD", x_brace_offset=3.0)
+    for name, section in sections.iterrows():
+        capacity = comp.w_section_capacity_from_series(section, 10*12, 10*12, 10*12, 50, "LRFD", x_brace_offset=3.0, value_only=True)
+        assert isclose(capacities[name], capacity)
+
+    # Precomputed rx, ry and h0 give the same results as computing them per call
+    derived_sections = comp.add_derived_properties(sections)
+    capacities = comp.w_section_capacity_vectorized(derived_sections, 10*12, 10*12, 10*12, 50, "LRFD", x_brace_offset=3.0)
+    for name, section in derived_sections.iterrows():
+        capacity = comp.w_section_capacity_from_series(section, 10*12, 10*12, 10*12, 50, "LRFD", x_brace_offset=3.0, value_only=True)
+        assert isclose(capacities[name], capacity)
+
+
+    # A frame with its own h0 column but no rx_calc/ry_calc still gets all three derived properties
+    partial_sections = sections.assign(h0=sections["d"] - sections["tf"])
+    capacities = comp.w_section_capacity_vectorized(partial_sections, 10*12, 10*12, 10*12, 50, "LRFD", x_brace_offset=3.0)
+    for name, section in partial_sections.iterrows():
+        capacity = comp.w_section_capacity_from_series(section, 10*12, 10*12, 10*12, 50, "LRFD", x_brace_offset=3.0, value_only=True)
+        assert isclose(capacities[name], capacity)
+
+def test_w_is_slender_comp_web_height():
+    # W40X324, Fy=50ksi: the web is slender if its height is taken as d - kdes, but not with
+    # h = d - 2*kdes (Table B4.1a, case 5), so the section is nonslender
+    A=95.3
+    bf=15.9
+    tf=1.81
+    d=40.2
+    kdes=2.99
+    tw=1.00
+    Ix=25600
+    Iy=1220
+    J=79.4
+    Cw=448000
+
+    Fy=50
+    E=29000
+
+    old_web_wt_ratio = (d-kdes)/tw
+    assert old_web_wt_ratio > dr.limiting_wt_ratio_comp(5, E, Fy)
+    assert dr.w_is_slender_comp(bf, tf, d, kdes, tw, Fy, E) is False
+
+    capacity, warnings, notes = comp.w_section_capacity(area=A, Ix=Ix, Iy=Iy, J=J, warping_constant=Cw,
+                                                        flange_width=bf, flange_thickness=tf, section_depth=d, kdes=kdes, web_thickness=tw,
+                                                        unbraced_length_x=10*12, unbraced_length_y=10*12, unbraced_length_z=10*12,
+                                                        yield_stress=Fy, design_method="LRFD")
+    assert "Shape is slender for compression." not in notes
+
+
+def test_w_section_capacity_from_series():
+    # W10X22, Lx=19.26ft, Ly=5ft, Lz=5ft, Fy=50ksi
+    section = pd.Series({"A":6.49, "Ix":118, "Iy":11.4, "J":0.239, "Cw":275, "bf":5.75, "tf":0.360,
+                         "d":10.2, "kdes":0.660, "tw":0.240}, name="W10X22")
+    properties = dict(area=6.49, Ix=118, Iy=11.4, J=0.239, warping_constant=275,
+                      flange_width=5.75, flange_thickness=0.360, section_depth=10.2, kdes=0.660, web_thickness=0.240)
+    Lx=19.26*12
+    Ly=5*12
+    Lz=5*12
+
+    for design_method in ["nominal", "LRFD", "ASD"]:
+        capacity, report, warnings, notes = comp.w_section_capacity_from_series(section, Lx, Ly, Lz, 50, design_method)
+        assert capacity == comp.w_section_capacity_from_series(section, Lx, Ly, Lz, 50, design_method, value_only=True)
+
+        expected_capacity, expected_warnings, expected_notes = comp.w_section_capacity(**properties,
+                                                                                       unbraced_length_x=Lx, unbraced_length_y=Ly, unbraced_length_z=Lz,
+                                                                                       yield_stress=50, design_method=design_method)
+        expected_report, _, _ = comp.w_section_capacity(**properties,
+                                                        unbraced_length_x=Lx, unbraced_length_y=Ly, unbraced_length_z=Lz,
+                                                        yield_stress=50, design_method=design_method, return_report=True)
+        assert capacity == expected_capacity
+        assert report == expected_report
+        assert warnings == expected_warnings
+        assert notes == expected_notes == ["Shape is slender for compression."]
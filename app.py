@@ -3,7 +3,41 @@ import pandas as pd
 import sections_db as sd
 import aisc_360_22.compression as comp
 
-section_data = sd.aisc_w_sections()
+SECTION_FORMAT = {"W":"{:.1f}", "A":"{:.2f}", "d":"{:.2f}", "bf":"{:.2f}",
+                  "tw":"{:.3f}", "tf":"{:.3f}", "kdes":"{:.3f}",
+                  "Ix":"{:.2f}", "Zx":"{:.2f}", "Sx":"{:.2f}", "rx":"{:.3f}",
+                  "Iy":"{:.2f}", "Zy":"{:.2f}", "Sy":"{:.2f}", "ry":"{:.3f}",
+                  "J":"{:.4f}", "Cw":"{:.2f}", "T":"{:.2f}"}
+RESULTS_FORMAT = {"W":"{:.1f}", "d":"{:.2f}", "bf":"{:.2f}", "tw":"{:.3f}", "tf":"{:.3f}",
+                  "Capacity":"{:.2f}", "SR":"{:.2f}"}
+REPORT_UNITS = {"":"", "force":"kip", "stress": "ksi", "area": "in²"}
+
+
+@st.cache_resource
+def load_sections():
+    # rx, ry and h0 are static section properties, so compute them once instead of on every capacity check.
+    # cache_resource shares one frame instead of unpickling a copy per call like cache_data; nothing below
+    # writes to it in place, and under Copy-on-Write the filtered and sorted frames never write through to it
+    return comp.add_derived_properties(sd.aisc_w_sections())
+
+
+@st.cache_data
+def section_capacity(section_name, length_x, length_y, length_z, yield_stress, design_method,
+                     length_factor_x, length_factor_y, length_factor_z):
+    # Keyed on the section name so reruns that only change unrelated widgets skip the Chapter E math
+    section = load_sections().loc[section_name]
+    return comp.w_section_capacity_from_series(section, length_x, length_y, length_z, yield_stress, design_method,
+                                               kx=length_factor_x, ky=length_factor_y, kz=length_factor_z)
+
+
+@st.cache_data
+def batch_capacities(sections, length_x, length_y, length_z, yield_stress, design_method,
+                     length_factor_x, length_factor_y, length_factor_z):
+    return comp.w_section_capacity_vectorized(sections, length_x, length_y, length_z, yield_stress, design_method,
+                                              kx=length_factor_x, ky=length_factor_y, kz=length_factor_z)
+
+
+section_data = load_sections()
 
 st.title("AISC W-Section Column Designer")
 
@@ -49,9 +83,8 @@ with tab1:
     col1, col2 = st.columns(2)
     with col1:
         section_name = st.selectbox("Section", section_data.index)
-        section = section_data.loc[section_name]
-        capacity, warnings, notes = comp.w_section_capacity_from_series(section, length_x, length_y, length_z, yield_stress, design_method, 
-                                               kx=length_factor_x, ky=length_factor_y, kz=length_factor_z)
+        capacity, report, warnings, notes = section_capacity(section_name, length_x, length_y, length_z, yield_stress, design_method,
+                                                             length_factor_x, length_factor_y, length_factor_z)
         st.write(f"Section Capacity: {round(capacity, 1)} kips")
         stress_ratio = applied_load/capacity
         st.write(f"Utilization Ratio: {round(stress_ratio, 2)}")
@@ -72,20 +105,14 @@ with tab1:
                 st.write(note)
         else:
             st.write("No notes")
-    st.header("Section Data")
-    st.table(pd.DataFrame(section).transpose().style.format({"W":"{:.1f}", "A":"{:.2f}", "d":"{:.2f}", "bf":"{:.2f}",
-                                                             "tw":"{:.3f}", "tf":"{:.3f}", "kdes":"{:.3f}",
-                                                             "Ix":"{:.2f}", "Zx":"{:.2f}", "Sx":"{:.2f}", "rx":"{:.3f}",
-                                                             "Iy":"{:.2f}", "Zy":"{:.2f}", "Sy":"{:.2f}", "ry":"{:.3f}",
-                                                             "J":"{:.4f}", "Cw":"{:.2f}", "T":"{:.2f}"}))
-    st.image("Diagram.png")
-    st.write("Diagram created in LibreCAD")
-    st.header("Design Details")
-    report = comp.w_section_capacity_from_series(section, length_x, length_y, length_z, yield_stress, design_method, 
-                                               kx=length_factor_x, ky=length_factor_y, kz=length_factor_z, value_only=True, return_report=True)
-    units = {"":"", "force":"kip", "stress": "ksi", "area": "in²"}
-    for description, value in report.items():
-        st.write(description + " = " + str(round(value[0], 2)) + " " + units[value[1]])
+    with st.expander("Section Data", expanded=False):
+        section = section_data.loc[section_name].drop(list(comp.DERIVED_PROPERTY_COLUMNS))
+        st.table(pd.DataFrame(section).transpose().style.format(SECTION_FORMAT))
+        st.image("Diagram.png")
+        st.write("Diagram created in LibreCAD")
+    with st.expander("Design Details", expanded=False):
+        for description, value in report.items():
+            st.write(description + " = " + str(round(value[0], 2)) + " " + REPORT_UNITS[value[1]])
 with tab2:
     col3, col4 = st.columns(2)
     with col3:
@@ -94,19 +121,16 @@ with tab2:
     with col4:
         bmax = st.number_input("Maximum width", min_value=0.0, value=16.0)
         bmin = st.number_input("Minimum width", min_value=0.0)
-    filtered_sections = section_data.copy()
-    capacities = filtered_sections.apply(comp.w_section_capacity_from_series,axis=1, 
-                                         unbraced_length_x=length_x, unbraced_length_y=length_y, unbraced_length_z=length_z,
-                                         yield_stress=yield_stress, design_method=design_method, 
-                                         kx=length_factor_x, ky=length_factor_y, kz=length_factor_z, value_only=True)
-    stress_ratios = capacities.apply(lambda x: applied_load/x)
+    # Apply the depth and width limits first so capacities are only computed for sections that can be shown,
+    # sorting by weight in the same gather
+    filtered_sections = sd.sections_filter_sorted_by_weight(section_data, [("d", "le", dmax), ("bf", "le", bmax),
+                                                                           ("d", "ge", dmin), ("bf", "ge", bmin)])
+    capacities = batch_capacities(filtered_sections, length_x, length_y, length_z, yield_stress, design_method,
+                                  length_factor_x, length_factor_y, length_factor_z)
+    stress_ratios = applied_load / capacities
     filtered_sections = filtered_sections.filter(["W", "d", "bf", "tw", "tf"])
     filtered_sections.insert(1, "Capacity", capacities)
     filtered_sections.insert(2, "SR", stress_ratios)
-    filtered_sections = sd.sort_by_weight(filtered_sections)
     section_mask = filtered_sections["Capacity"] >= applied_load
     filtered_sections = filtered_sections.loc[section_mask]
-    filtered_sections = sd.sections_filter(sd.sections_filter(filtered_sections, "le", d=dmax), "ge", d=dmin)
-    filtered_sections = sd.sections_filter(sd.sections_filter(filtered_sections, "le", bf=bmax), "ge", bf=bmin)
-    st.table(filtered_sections.style.format({"W":"{:.1f}", "d":"{:.2f}", "bf":"{:.2f}", "tw":"{:.3f}", "tf":"{:.3f}",
-                                             "Capacity":"{:.2f}", "SR":"{:.2f}"}))
+    st.table(filtered_sections.style.format(RESULTS_FORMAT))
@@ -1,25 +1,184 @@
+import os
+from collections.abc import Sequence
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 
-def aisc_w_sections()->pd.DataFrame:
-    filepath = "aisc_section_databases/aisc_w_db_us.csv"
-    w_df = pd.read_csv(filepath).set_index("Section")
+# Filtering and sorting return new frames, so with Copy-on-Write the slices never need a defensive copy.
+# CoW is always on from pandas 3.0, where the option is deprecated.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+AISC_W_CSV_FILEPATH = "aisc_section_databases/aisc_w_db_us.csv"
+AISC_W_FEATHER_FILEPATH = "aisc_section_databases/aisc_w_db_us.feather"
+COMPARISON_OPERATORS = {"ge": np.greater_equal, "le": np.less_equal}
+# Explicit column types let read_csv skip type inference. AISC publishes 3-4 significant figures, well within
+# float32's ~7, at half the memory of float64. float32 does not hold most tabulated values exactly, so the filters
+# cast each limit to the column's dtype before comparing; otherwise a float64 limit equal to a table value fails ge/le
+AISC_W_DTYPES = {"Section": "string",
+                 "W": "float32", "A": "float32", "d": "float32", "bf": "float32",
+                 "tw": "float32", "tf": "float32", "kdes": "float32",
+                 "Ix": "float32", "Zx": "float32", "Sx": "float32", "rx": "float32",
+                 "Iy": "float32", "Zy": "float32", "Sy": "float32", "ry": "float32",
+                 "J": "float32", "Cw": "float32", "T": "float32"}
+# Column positions in the table returned by aisc_w_sections, for sections_filter_fast
+AISC_W_COLUMN_INDICES = {column: i for i, column in enumerate(column for column in AISC_W_DTYPES if column != "Section")}
+
+
+def _read_aisc_w_csv() -> pd.DataFrame:
+    return pd.read_csv(AISC_W_CSV_FILEPATH, dtype=AISC_W_DTYPES, usecols=list(AISC_W_DTYPES), engine="c", memory_map=True)
+
+
+def convert_aisc_w_sections_to_feather() -> pd.DataFrame:
+    """
+    Convert the AISC W-section CSV to Feather so later loads skip CSV parsing
+    Returns the table read from the CSV; raises ImportError if pyarrow is not installed
+    """
+    w_df = _read_aisc_w_csv()
+    # Write next to the target and rename it into place, so a reader never sees a partly written file
+    temporary_filepath = f"{AISC_W_FEATHER_FILEPATH}.{os.getpid()}.tmp"
+    try:
+        # Uncompressed so the file can be memory-mapped without a decompression pass
+        w_df.to_feather(temporary_filepath, compression="uncompressed")
+        os.replace(temporary_filepath, AISC_W_FEATHER_FILEPATH)
+    finally:
+        if os.path.exists(temporary_filepath):
+            os.remove(temporary_filepath)
     return w_df
 
 
-def sections_filter(df: pd.DataFrame, operator: str, **kwargs) -> pd.DataFrame:
-    sub_df = df.copy()
-    
-    for parameter, value in kwargs.items():
-        if operator == "ge":
-            mask = sub_df[parameter] >= value
-        elif operator == "le":
-            mask = sub_df[parameter] <= value
+def _read_aisc_w_feather() -> pd.DataFrame:
+    from pyarrow import feather
+    # Memory-mapped, so the file is not first read into a separate buffer; to_pandas still copies the
+    # columns out of the mapping into NumPy arrays
+    return feather.read_table(AISC_W_FEATHER_FILEPATH, memory_map=True).to_pandas()
+
+
+@lru_cache(maxsize=1)
+def _read_aisc_w_sections()->pd.DataFrame:
+    # Use the Feather copy of the CSV, (re)building it when missing, stale or unreadable;
+    # plain CSV if pyarrow is unavailable or the Feather file cannot be written
+    try:
+        if (os.path.exists(AISC_W_FEATHER_FILEPATH)
+                and os.path.getmtime(AISC_W_FEATHER_FILEPATH) >= os.path.getmtime(AISC_W_CSV_FILEPATH)):
+            try:
+                w_df = _read_aisc_w_feather()
+            except (OSError, ValueError):
+                # A truncated or corrupt file raises pyarrow.ArrowInvalid, a ValueError
+                w_df = convert_aisc_w_sections_to_feather()
         else:
-            raise ValueError("Invalid comparison type")
-        sub_df = sub_df.loc[mask]
-    return sub_df
+            w_df = convert_aisc_w_sections_to_feather()
+    except (ImportError, OSError, ValueError):
+        w_df = _read_aisc_w_csv()
+    # Feather files written before AISC_W_DTYPES, or columns it does not list, may still be float64.
+    # W stays float32 rather than int16 because the light shapes have fractional weights (W6X8.5)
+    w_df = w_df.astype({column: "float32" for column in w_df.select_dtypes("float64").columns})
+    # A current Feather file already loads as one float32 block, but the CSV fallback (and astype on an older
+    # float64 Feather file) leaves one block per column. Copying once consolidates those into a single 2D block,
+    # so each positional row gather in sections_filter is one take instead of one per column
+    return w_df.set_index("Section").copy()
+
+
+def aisc_w_sections()->pd.DataFrame:
+    # The CSV is parsed once per process; under Copy-on-Write a shallow copy shares the cached data
+    # but keeps callers' edits from leaking back into the cache
+    return _read_aisc_w_sections().copy(deep=False)
+
+
+def sections_filter_predicates(df: pd.DataFrame, predicates: Sequence[tuple[str, str, float]]) -> pd.DataFrame:
+    # Each predicate is (column, "ge" or "le", value); rows must satisfy all of them
+    return _filter_comparisons(df, _resolve_comparisons(predicates))
+
+
+def sections_filter_sorted_by_weight(df: pd.DataFrame, predicates: Sequence[tuple[str, str, float]],
+                                     ascending: bool=True) -> pd.DataFrame:
+    # Same as sort_by_weight(sections_filter_predicates(df, predicates)), but sorts the surviving row positions
+    # first so the frame is gathered once instead of once per step
+    positions = np.flatnonzero(_comparisons_mask(df, _resolve_comparisons(predicates)))
+    weights = df["W"].to_numpy()[positions]
+    order = np.argsort(weights if ascending else -weights, kind="stable")
+    return df.take(positions[order])
+
+
+def sections_filter(df: pd.DataFrame, operator: str, **kwargs) -> pd.DataFrame:
+    # Every kwarg shares one operator, so it is validated and looked up once
+    compare = _resolve_operator(operator)
+    return _filter_comparisons(df, [(parameter, compare, value) for parameter, value in kwargs.items()])
+
+
+def _resolve_operator(operator: str):
+    compare = COMPARISON_OPERATORS.get(operator)
+    if compare is None:
+        raise ValueError("Invalid comparison type")
+    return compare
+
+
+def _resolve_comparisons(predicates: Sequence[tuple[str, str, float]]) -> list:
+    # Validate the operator strings up front and swap them for the NumPy ufuncs used in the comparison loop
+    return [(parameter, _resolve_operator(operator), value) for parameter, operator, value in predicates]
+
+
+def _filter_comparisons(df: pd.DataFrame, comparisons: list) -> pd.DataFrame:
+    if any(parameter == "W" for parameter, _, _ in comparisons) and df["W"].is_monotonic_increasing:
+        # Frames sorted by weight (e.g. by sort_by_weight) can be cut to a contiguous slice by binary search
+        weights = df["W"].to_numpy()
+        start, stop = 0, len(df)
+        for parameter, compare, value in comparisons:
+            # searchsorted would promote float32 weights to float64; compare in W's own type like the mask path
+            if parameter == "W" and compare is np.greater_equal:
+                start = max(start, np.searchsorted(weights, _as_column_type(weights, value), side="left"))
+            elif parameter == "W":
+                stop = min(stop, np.searchsorted(weights, _as_column_type(weights, value), side="right"))
+        df = df.iloc[start:stop]
+        comparisons = [comparison for comparison in comparisons if comparison[0] != "W"]
+        if not comparisons:
+            return df
+    if len(comparisons) == 1:
+        # The common single-criterion case needs one comparison and no mask combining
+        (parameter, compare, value), = comparisons
+        column = df[parameter].to_numpy()
+        return df.iloc[compare(column, _as_column_type(column, value))]
+    return df.iloc[_comparisons_mask(df, comparisons)]
+
+
+def sections_filter_fast(df: pd.DataFrame, col_indices: Sequence[int], vals: Sequence[float],
+                         is_ge: Sequence[bool]) -> pd.DataFrame:
+    # Positional form of sections_filter_predicates for callers that resolve their columns once:
+    # keeps rows where column col_indices[j] is >= vals[j] if is_ge[j], else <= vals[j], for every j.
+    # AISC_W_COLUMN_INDICES maps the W-section table's column names to positions
+    columns = [df.iloc[:, column].to_numpy() for column in col_indices]
+    return df.iloc[_columns_mask(len(df), columns, vals, is_ge)]
+
+
+def _comparisons_mask(df: pd.DataFrame, comparisons: list) -> np.ndarray:
+    return _columns_mask(len(df), [df[parameter].to_numpy() for parameter, _, _ in comparisons],
+                         [value for _, _, value in comparisons],
+                         [compare is np.greater_equal for _, compare, _ in comparisons])
+
+
+def _columns_mask(n_rows: int, columns: list, vals, is_ge) -> np.ndarray:
+    # Each column is compared on its own array: a whole-frame to_numpy() would upcast float32 columns
+    # to float64 whenever the frame also holds float64 columns. One scratch buffer is reused
+    # instead of a temporary mask per predicate
+    mask = np.ones(n_rows, dtype=bool)
+    scratch = np.empty_like(mask)
+    for column, value, ge in zip(columns, vals, is_ge):
+        mask &= (np.greater_equal if ge else np.less_equal)(column, _as_column_type(column, value), out=scratch)
+    return mask
+
+
+def _as_column_type(column: np.ndarray, value):
+    # Compare in the column's own float type, so a limit equal to a tabulated value (13.7 stored as float32)
+    # matches it inclusively whatever the Python or NumPy type of the limit
+    if np.issubdtype(column.dtype, np.floating):
+        return column.dtype.type(value)
+    return value
 
 
 def sort_by_weight(df: pd.DataFrame, ascending: bool=True) -> pd.DataFrame:
-    sub_df = df.copy()
-    return sub_df.sort_values("W", ascending=ascending)
+    weights = df["W"].to_numpy()
+    # An O(N) monotonicity check is cheaper than sorting frames that are already in weight order
+    if (weights[1:] >= weights[:-1]).all() if ascending else (weights[1:] <= weights[:-1]).all():
+        return df
+    # Stable NumPy argsort on the raw weights, then one positional gather; skips sort_values' Series dispatch
+    return df.take(np.argsort(weights if ascending else -weights, kind="stable"))
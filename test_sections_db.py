@@ -1,3 +1,5 @@
+import pytest
+import numpy as np
 import pandas as pd
 import sections_db as sd
 
@@ -20,5 +22,127 @@ def test_sections_filter():
                                 "C":[15, 20],
                                 "D":[18, 24]})
     
+    A_ge_6_D_ge_18 = sd.sections_filter(test_df, "ge", A=6, D=18).reset_index(drop=True)
+    compound_answer = pd.DataFrame({"A":[9, 12],
+                                    "B":[12, 16],
+                                    "C":[15, 20],
+                                    "D":[18, 24]})
+
     assert B_le_10.equals(le_answer)
-    assert C_ge_13.equals(ge_answer)
\ No newline at end of file
+    assert C_ge_13.equals(ge_answer)
+    assert A_ge_6_D_ge_18.equals(compound_answer)
+    with pytest.raises(ValueError):
+        sd.sections_filter(test_df, "gt", B=10)
+
+def test_sections_filter_on_weight_sorted_frame():
+    sorted_df = pd.DataFrame({"W":[8.5, 10, 10, 12, 15],
+                              "d":[4, 6, 4, 6, 8]})
+
+    W_ge_10 = sd.sections_filter(sorted_df, "ge", W=10)
+    W_le_10 = sd.sections_filter(sorted_df, "le", W=10)
+    W_le_12_d_le_4 = sd.sections_filter(sorted_df, "le", W=12, d=4)
+
+    assert W_ge_10.equals(sorted_df.iloc[1:])
+    assert W_le_10.equals(sorted_df.iloc[:3])
+    assert W_le_12_d_le_4.equals(sorted_df.iloc[[0, 2]])
+    assert sd.sections_filter_predicates(sorted_df, [("W", "ge", 10), ("W", "le", 12)]).equals(sorted_df.iloc[1:4])
+    # Unsorted frames give the same rows as the sorted ones
+    assert sd.sections_filter(sorted_df.iloc[::-1], "ge", W=10).sort_index().equals(W_ge_10)
+
+
+def test_sections_filter_predicates():
+    B_ge_8_D_le_18 = sd.sections_filter_predicates(test_df, [("B", "ge", 8), ("D", "le", 18)]).reset_index(drop=True)
+    answer = pd.DataFrame({ "A":[6, 9],
+                            "B":[8, 12],
+                            "C":[10, 15],
+                            "D":[12, 18]})
+
+    assert B_ge_8_D_le_18.equals(answer)
+    assert sd.sections_filter_predicates(test_df, []).equals(test_df)
+    with pytest.raises(ValueError):
+        sd.sections_filter_predicates(test_df, [("B", "gt", 8)])
+
+
+def test_sections_filter_sorted_by_weight():
+    unsorted_df = pd.DataFrame({"W":[15, 8.5, 12, 10],
+                                "d":[8, 4, 6, 4]})
+
+    d_ge_5 = sd.sections_filter_sorted_by_weight(unsorted_df, [("d", "ge", 5)])
+    d_le_6_descending = sd.sections_filter_sorted_by_weight(unsorted_df, [("d", "le", 6)], ascending=False)
+
+    assert d_ge_5.equals(unsorted_df.iloc[[2, 0]])
+    assert d_le_6_descending.equals(unsorted_df.iloc[[2, 3, 1]])
+
+
+def test_sort_by_weight():
+    unsorted_df = pd.DataFrame({"W":[15, 8.5, 12, 10],
+                                "d":[8, 4, 6, 4]})
+
+    ascending = sd.sort_by_weight(unsorted_df)
+    descending = sd.sort_by_weight(unsorted_df, ascending=False)
+
+    assert ascending.equals(unsorted_df.iloc[[1, 3, 2, 0]])
+    assert descending.equals(unsorted_df.iloc[[0, 2, 3, 1]])
+    assert sd.sort_by_weight(ascending).equals(ascending)
+    assert sd.sort_by_weight(ascending, ascending=False).equals(descending)
+
+
+def test_sections_filter_fast():
+    B_ge_8_D_le_18 = sd.sections_filter_fast(test_df, [1, 3], [8, 18], [True, False]).reset_index(drop=True)
+    answer = pd.DataFrame({ "A":[6, 9],
+                            "B":[8, 12],
+                            "C":[10, 15],
+                            "D":[12, 18]})
+
+    assert B_ge_8_D_le_18.equals(answer)
+    assert B_ge_8_D_le_18.equals(sd.sections_filter_predicates(test_df, [("B", "ge", 8), ("D", "le", 18)]).reset_index(drop=True))
+
+
+def test_sections_filter_mixed_float_columns():
+    # float32 section properties next to float64 derived columns, as in the app's table
+    mixed_df = pd.DataFrame({"W":np.array([22, 43, 152], dtype=np.float32),
+                             "d":np.array([13.7, 13.7, 13.8], dtype=np.float32),
+                             "h0":np.array([13.4, 13.2, 12.1], dtype=np.float64)})
+
+    d_is_13_7 = mixed_df.iloc[:2]
+
+    assert sd.sections_filter(mixed_df, "ge", d=13.7, h0=13.0).equals(d_is_13_7)
+    assert sd.sections_filter(mixed_df, "le", d=13.7).equals(d_is_13_7)
+    assert sd.sections_filter_predicates(mixed_df, [("d", "ge", 13.7), ("d", "le", 13.7)]).equals(d_is_13_7)
+    assert sd.sections_filter_fast(mixed_df, [1, 1], [13.7, 13.7], [True, False]).equals(d_is_13_7)
+    assert sd.sections_filter_sorted_by_weight(mixed_df, [("d", "ge", 13.7), ("d", "le", 13.7)]).equals(d_is_13_7)
+
+
+def test_sections_filter_float32_weight_on_sorted_frame():
+    # 10.1 has no exact float32 value, so the sorted and unsorted frames must compare it the same way
+    float32_df = pd.DataFrame({"W":np.array([9.9, 10.1, 10.3], dtype=np.float32)})
+
+    assert sd.sections_filter(float32_df, "le", W=10.1).equals(float32_df.iloc[:2])
+    assert sd.sections_filter(float32_df, "ge", W=10.1).equals(float32_df.iloc[1:])
+    assert sd.sections_filter(float32_df.iloc[::-1], "le", W=10.1).sort_index().equals(float32_df.iloc[:2])
+
+
+def test_sections_filter_float64_limits():
+    # W4X13 has d = 4.16; a float64 limit of the same value must still match the float32 column inclusively
+    float32_df = pd.DataFrame({"W":np.array([13, 16], dtype=np.float32),
+                               "d":np.array([4.16, 4.25], dtype=np.float32)},
+                              index=["W4X13", "W5X16"])
+
+    assert sd.sections_filter(float32_df, "ge", d=np.float64(4.16)).equals(float32_df)
+    assert sd.sections_filter(float32_df, "le", d=np.float64(4.16)).equals(float32_df.iloc[:1])
+    assert sd.sections_filter_fast(float32_df, np.array([1]), np.array([4.16]), np.array([True])).equals(float32_df)
+
+
+def test_aisc_w_sections_rebuilds_corrupt_feather(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    feather_filepath = tmp_path / "aisc_w_db_us.feather"
+    expected = sd.aisc_w_sections()
+    # Truncated file, newer than the CSV so it is not treated as stale
+    feather_filepath.write_bytes(b"ARROW1\x00\x00")
+    monkeypatch.setattr(sd, "AISC_W_FEATHER_FILEPATH", str(feather_filepath))
+    sd._read_aisc_w_sections.cache_clear()
+    try:
+        assert sd.aisc_w_sections().equals(expected)
+        assert sd._read_aisc_w_feather().set_index("Section").index.equals(expected.index)
+    finally:
+        sd._read_aisc_w_sections.cache_clear()